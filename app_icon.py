@@ -1,55 +1,114 @@
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QPen
-from PyQt5.QtCore import  Qt, QRect
+import os
+from PyQt5.QtGui import QIcon, QIconEngine, QImage, QPixmap, QPainter, QPainterPath, QColor, QPen, QTransform
+from PyQt5.QtCore import  Qt, QRect, QRectF, QSize
+from app_icons import AppIcons
 
-class AppIcon:
-    @staticmethod
-    def create_app_icon() -> QIcon:
-        sizes = [16, 32, 48, 64, 128, 256]
-        icon = QIcon()
-        primary_color = "#2563eb"
-        
-        for size in sizes:
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            center = size // 2
-            
-            circle_size = int(size * 0.2)
-            circle_pos = center - circle_size // 2
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(primary_color))
-            painter.drawEllipse(
-                circle_pos,
-                circle_pos,
-                circle_size,
-                circle_size
-            )
-            
-            pen = QPen(QColor(primary_color))
-            pen.setWidth(max(1, int(size * 0.02)))
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            
-            orbit_size = int(size * 0.8)
-            orbit_rect = QRect(
-                center - orbit_size // 2,
-                center - orbit_size // 4,
-                orbit_size,
-                orbit_size // 2
-            )
-            
-            for angle in [0, 60, 120]:
-                painter.save()
-                painter.translate(center, center)
-                painter.rotate(angle)
-                painter.translate(-center, -center)
-                painter.drawEllipse(orbit_rect)
-                painter.restore()
-            
+MASTER_SIZE = 256
+PRIMARY_COLOR = QColor("#2563eb")
+
+def _build_orbit_path(size: int) -> QPainterPath:
+    center = size // 2
+    orbit_size = int(size * 0.8)
+    orbit = QPainterPath()
+    orbit.addEllipse(QRectF(
+        center - orbit_size // 2,
+        center - orbit_size // 4,
+        orbit_size,
+        orbit_size // 2
+    ))
+
+    # Üç yörünge tek bir path içinde birleştirilir
+    path = QPainterPath()
+    for angle in [0, 60, 120]:
+        transform = QTransform().translate(center, center).rotate(angle).translate(-center, -center)
+        path.addPath(transform.map(orbit))
+    return path
+
+_ORBIT_PATH = _build_orbit_path(MASTER_SIZE)
+
+def _build_circle_rect(size: int) -> QRectF:
+    center = size // 2
+    circle_size = int(size * 0.2)
+    circle_pos = center - circle_size // 2
+    return QRectF(circle_pos, circle_pos, circle_size, circle_size)
+
+_CIRCLE_RECT = _build_circle_rect(MASTER_SIZE)
+
+# Yörünge kalemi ana boyutta tanımlanır ve painter ölçeğiyle birlikte incelir
+_ORBIT_PEN = QPen(PRIMARY_COLOR)
+_ORBIT_PEN.setWidth(int(MASTER_SIZE * 0.02))
+
+# Ölçeklenen kalem 1 pikselin altına düştüğünde sabit 1 piksellik kalem kullanılır
+_HAIRLINE_PEN = QPen(PRIMARY_COLOR)
+_HAIRLINE_PEN.setWidth(1)
+_HAIRLINE_PEN.setCosmetic(True)
+
+def _paint_app_icon(painter: QPainter, size: int):
+    scale = size / MASTER_SIZE
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.scale(scale, scale)
+
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(PRIMARY_COLOR)
+    painter.drawEllipse(_CIRCLE_RECT)
+
+    painter.setPen(_ORBIT_PEN if _ORBIT_PEN.width() * scale >= 1 else _HAIRLINE_PEN)
+    painter.setBrush(Qt.NoBrush)
+    painter.drawPath(_ORBIT_PATH)
+
+class _AppIconEngine(QIconEngine):
+    """Paints the app icon on demand at the exact size Qt asks for"""
+
+    SIZES = [16, 32, 48, 64, 128, 256]
+
+    def __init__(self):
+        super().__init__()
+        self._pixmaps = {}
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        side = min(size.width(), size.height())
+        pixmap = self._pixmaps.get(side)
+        if pixmap is None:
+            image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+
+            painter = QPainter(image)
+            _paint_app_icon(painter, side)
             painter.end()
-            icon.addPixmap(pixmap)
-            
-        return icon
\ No newline at end of file
+            pixmap = self._pixmaps[side] = QPixmap.fromImage(image, Qt.NoFormatConversion)
+        return pixmap
+
+    def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State):
+        side = min(rect.width(), rect.height())
+        painter.save()
+        painter.translate(
+            rect.x() + (rect.width() - side) // 2,
+            rect.y() + (rect.height() - side) // 2
+        )
+        _paint_app_icon(painter, side)
+        painter.restore()
+
+    def availableSizes(self, mode=QIcon.Normal, state=QIcon.Off):
+        return [QSize(size, size) for size in self.SIZES]
+
+    def clone(self) -> QIconEngine:
+        return _AppIconEngine()
+
+class AppIcon:
+    # tools/bake_icons.py ile üretilen çok boyutlu ikon
+    ICO_PATH = os.path.join(AppIcons.ICON_DIR, 'app-icon.ico')
+
+    _app_icon = None
+
+    @classmethod
+    def create_app_icon(cls) -> QIcon:
+        if cls._app_icon is None:
+            # Önce hazır .ico, sonra SVG denenir; ikisi de yoksa ikon çizilir
+            if os.path.exists(cls.ICO_PATH):
+                cls._app_icon = QIcon(cls.ICO_PATH)
+            else:
+                try:
+                    cls._app_icon = AppIcons.get_app_icon()
+                except FileNotFoundError:
+                    cls._app_icon = QIcon(_AppIconEngine())
+        return cls._app_icon
@@ -1,27 +1,45 @@
 import os
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QSize, Qt
-from PyQt5.QtSvg import QSvgRenderer
+
+def _scan_icon_dir(icon_dir: str) -> dict:
+    """Map icon names to their SVG paths with a single directory scan"""
+    if not os.path.isdir(icon_dir):
+        return {}
+    with os.scandir(icon_dir) as entries:
+        return {
+            os.path.splitext(entry.name)[0]: entry.path
+            for entry in entries
+            if entry.name.endswith('.svg')
+        }
 
 class AppIcons:
     """Application icons handler"""
     
     # İkon dosyalarının bulunduğu dizin
     ICON_DIR = os.path.join(os.path.dirname(__file__), 'icons')
+    _ICON_PATHS = _scan_icon_dir(ICON_DIR)
+    
+    # Yüklenen ikonlar isme göre önbelleğe alınır
+    _icon_cache = {}
     
     @classmethod
     def load_icon(cls, name: str) -> QIcon:
-        """Load icon from icons directory"""
-        icon_path = os.path.join(cls.ICON_DIR, f"{name}.svg")
-        if not os.path.exists(icon_path):
-            raise FileNotFoundError(f"Icon not found: {icon_path}")
-            
-        icon = QIcon(icon_path)
-        # Farklı boyutlarda otomatik ölçeklendirme
-        for size in [16, 24, 32, 48, 64, 128]:
-            icon.addPixmap(icon.pixmap(QSize(size, size)))
+        """Load icon from icons directory (cached by name)"""
+        icon = cls._icon_cache.get(name)
+        if icon is None:
+            icon = cls._icon_cache[name] = cls._build_icon(name)
         return icon
     
+    @classmethod
+    def _build_icon(cls, name: str) -> QIcon:
+        """Read the SVG from disk and build its icon"""
+        icon_path = cls._ICON_PATHS.get(name)
+        if icon_path is None:
+            raise FileNotFoundError(f"Icon not found: {os.path.join(cls.ICON_DIR, name + '.svg')}")
+            
+        # SVG motoru istenen boyutta talep üzerine çizer
+        return QIcon(icon_path)
+    
     @classmethod
     def get_play_icon(cls) -> QIcon:
         return cls.load_icon('play')
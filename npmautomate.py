@@ -1,11 +1,16 @@
 import subprocess
+import shutil
 import os
 
+# npx/npm PATH üzerinden bir kez çözülür, bulunamazsa varsayılan Windows kurulum yolu kullanılır
+NPX = shutil.which("npx") or r"C:\Program Files\nodejs\npx.cmd"
+NPM = shutil.which("npm") or r"C:\Program Files\nodejs\npm.cmd"
+
 # Kullanıcıdan proje adı alma
 project_name = input("Proje adı girin (varsayılan: my-vite-app): ") or "my-vite-app"
 
-# Tam yol ile npx komutunu belirleme
-npx_command = [r"C:\Program Files\nodejs\npx.cmd", "create-vite@latest", project_name, "--template", "react"]
+# npx komutunu belirleme
+npx_command = [NPX, "create-vite@latest", project_name, "--template", "react"]
 
 try:
     # Projeyi oluştur
@@ -15,7 +20,7 @@ except subprocess.CalledProcessError as e:
     print(f"Hata: Proje oluşturulamadı.\n{e}")
     exit()
 except FileNotFoundError:
-    print("Hata: npx komutu bulunamadı. PATH ayarlarınızı kontrol edin.")
+    print(f"Hata: npx komutu bulunamadı ({NPX}). Node.js kurulumunu ve PATH ayarlarınızı kontrol edin.")
     exit()
 
 # Proje dizinine geçme
@@ -27,7 +32,7 @@ except FileNotFoundError:
     exit()
 
 # Bağımlılıkları yükleme
-npm_command = r"C:\Program Files\nodejs\npm.cmd"
+npm_command = NPM
 
 try:
     subprocess.run([npm_command, "install"], check=True)
@@ -35,10 +40,16 @@ try:
 except subprocess.CalledProcessError as e:
     print(f"Hata: Bağımlılıklar yüklenirken bir sorun oluştu.\n{e}")
     exit()
+except FileNotFoundError:
+    print(f"Hata: npm komutu bulunamadı ({NPM}). Node.js kurulumunu ve PATH ayarlarınızı kontrol edin.")
+    exit()
 
-# Projeyi başlatma
+# Projeyi başlatma (geliştirme sunucusu ayrı bir süreçte çalışır, script beklemez)
 try:
-    subprocess.run([npm_command, "run", "dev"], check=True)
-    print("Proje başarıyla başlatıldı!")
-except subprocess.CalledProcessError as e:
+    dev_server = subprocess.Popen(
+        [npm_command, "run", "dev"],
+        creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == "nt" else 0
+    )
+    print(f"Proje başarıyla başlatıldı! (PID: {dev_server.pid})")
+except OSError as e:
     print(f"Hata: Proje başlatılamadı.\n{e}")
@@ -0,0 +1,60 @@
+"""Bake the painted app icon into icons/app-icon.ico
+
+Run once after changing the AppIcon artwork:
+
+    python tools/bake_icons.py
+
+The .ico holds one PNG-compressed image per size and is loaded by
+AppIcon.create_app_icon at runtime instead of painting the icon.
+"""
+import os
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication
+
+from app_icon import _AppIconEngine
+
+ICO_PATH = os.path.join(ROOT, 'icons', 'app-icon.ico')
+
+
+def _png_bytes(icon: QIcon, size: int) -> bytes:
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    icon.pixmap(QSize(size, size)).save(buffer, 'PNG')
+    buffer.close()
+    return bytes(data)
+
+
+def write_ico(path: str, images: dict):
+    """Write {size: png_bytes} as a multi-resolution .ico file"""
+    header = struct.pack('<HHH', 0, 1, len(images))
+    entries = b''
+    payload = b''
+    offset = len(header) + 16 * len(images)
+    for size, png in sorted(images.items()):
+        # 256 piksel ICO dizininde 0 olarak yazılır
+        dim = size if size < 256 else 0
+        entries += struct.pack('<BBBBHHII', dim, dim, 0, 0, 1, 32, len(png), offset + len(payload))
+        payload += png
+    with open(path, 'wb') as f:
+        f.write(header + entries + payload)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    engine = _AppIconEngine()
+    icon = QIcon(engine)
+    images = {size: _png_bytes(icon, size) for size in engine.SIZES}
+    write_ico(ICO_PATH, images)
+    print(f"Wrote {ICO_PATH} ({', '.join(str(s) for s in sorted(images))})")
+
+
+if __name__ == '__main__':
+    main()